@@ -31,4 +31,5 @@
 
 """Common FhY Utilities, and Miscellaneous Fixings."""
 
+from .poset import PartiallyOrderedSet
 from .stack import Stack
@@ -0,0 +1,163 @@
+# Copyright (c) 2024 FhY Developers
+# Christopher Priebe <cpriebe@ucsd.edu>
+# Jason C Del Rio <j3delrio@ucsd.edu>
+# Hadi S Esmaeilzadeh <hadi@ucsd.edu>
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification, are
+# permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this list of
+# conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice, this list
+# of conditions and the following disclaimer in the documentation and/or other materials
+# provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors may be
+# used to endorse or promote products derived from this software without specific prior
+# written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS” AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES
+# OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT
+# SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
+# TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR
+# BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY
+# WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH
+# DAMAGE.
+
+"""Utility to track a strict partial order over a set of unique elements.
+
+Classes:
+    PartiallyOrderedSet: Bitset-backed strict partially ordered set
+
+"""
+
+from typing import Dict, Generic, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+def _iterate_set_bits(bitmap: int) -> Iterator[int]:
+    """Yield the index of each set bit in the bitmap, lowest first."""
+    while bitmap:
+        lowest_bit = bitmap & -bitmap
+        yield lowest_bit.bit_length() - 1
+        bitmap ^= lowest_bit
+
+
+class PartiallyOrderedSet(Generic[T]):
+    """A strict partially ordered set (poset) of unique, hashable elements.
+
+    The order relation is kept as a transitive closure over dense element
+    indices, with one arbitrary-precision integer bitmap per element. Order
+    queries are therefore a single bit test, and recording a new relation is
+    a handful of C-level bitwise merges instead of a graph traversal.
+
+    Example Usage:
+
+        .. code-block:: python
+
+            poset = PartiallyOrderedSet[int]()
+
+            poset.add_element(1)
+            poset.add_element(2)
+
+            # Record that 1 precedes 2 in the partial order
+            poset.add_order(1, 2)
+
+            assert poset.is_less_than(1, 2)
+            assert poset.is_greater_than(2, 1)
+
+            # Relations that would introduce a cycle will error
+            poset.add_order(2, 1)  # ValueError
+
+    """
+
+    _indices: Dict[T, int]
+    _elements: List[T]
+    _less_than: List[int]
+    _greater_than: List[int]
+
+    def __init__(self):
+        self._indices = {}
+        self._elements = []
+        self._less_than = []
+        self._greater_than = []
+
+    def add_element(self, element: T) -> None:
+        """Add an element to the poset, unordered relative to all others.
+
+        Raises:
+            ValueError: When the element is already present in the poset.
+
+        """
+        if element in self._indices:
+            raise ValueError(f"Element is already in the poset: {element}")
+
+        self._indices[element] = len(self._elements)
+        self._elements.append(element)
+        self._less_than.append(0)
+        self._greater_than.append(0)
+
+    def add_order(self, lower: T, upper: T) -> None:
+        """Record that "lower" precedes "upper" in the partial order.
+
+        The transitive closure is updated eagerly: every element at or below
+        "lower" is marked less than every element at or above "upper".
+
+        Raises:
+            KeyError: When either element is not present in the poset.
+            ValueError: When the relation would introduce a cycle.
+
+        """
+        lower_index = self._get_index(lower)
+        upper_index = self._get_index(upper)
+        if lower_index == upper_index or self._is_less(upper_index, lower_index):
+            raise ValueError(f"Order introduces a cycle: {lower} < {upper}")
+
+        above = self._less_than[upper_index] | (1 << upper_index)
+        below = self._greater_than[lower_index] | (1 << lower_index)
+        for index in _iterate_set_bits(below):
+            self._less_than[index] |= above
+        for index in _iterate_set_bits(above):
+            self._greater_than[index] |= below
+
+    def is_less_than(self, element_1: T, element_2: T) -> bool:
+        """Report whether element_1 strictly precedes element_2.
+
+        Raises:
+            KeyError: When either element is not present in the poset.
+
+        """
+        return self._is_less(self._get_index(element_1), self._get_index(element_2))
+
+    def is_greater_than(self, element_1: T, element_2: T) -> bool:
+        """Report whether element_1 strictly succeeds element_2.
+
+        Raises:
+            KeyError: When either element is not present in the poset.
+
+        """
+        return self._is_less(self._get_index(element_2), self._get_index(element_1))
+
+    def _get_index(self, element: T) -> int:
+        try:
+            return self._indices[element]
+        except KeyError as e:
+            raise KeyError(f"Element is not in the poset: {element}") from e
+
+    def _is_less(self, index_1: int, index_2: int) -> bool:
+        return bool((self._less_than[index_1] >> index_2) & 1)
+
+    def __contains__(self, element: T) -> bool:
+        return element in self._indices
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._elements)
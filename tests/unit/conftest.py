@@ -4,15 +4,28 @@ Fixtures present in this file are innately available to all modules present with
 directory. This is not true of Subdirectories, which will need it's own conftest.py
 file.
 
+The parsing fixtures are session scoped and construct_ast memoizes per source
+string, so parametrized tests that feed the same source (within or across test
+modules) share a single parse instead of re-running the ANTLR pipeline.
+
 """
 
+import functools
 from typing import Callable, List, Set
 
 import pytest
-from antlr4 import DFA, CommonTokenStream, InputStream, ParserRuleContext
+from antlr4 import (
+    DFA,
+    BailErrorStrategy,
+    CommonTokenStream,
+    InputStream,
+    ParserRuleContext,
+    PredictionMode,
+)
 from antlr4.atn.ATNConfigSet import ATNConfigSet
 from antlr4.atn.ATNState import DecisionState
 from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.Errors import ParseCancellationException
 from fhy import error as fhy_error
 from fhy.lang.ast import ASTNode
 from fhy.lang.converter.from_parse_tree import from_parse_tree
@@ -156,53 +169,136 @@ class ThrowingErrorListener(ErrorListener):
         return {i.alt for i in configs}
 
 
-@pytest.fixture(scope="module")
-def lexer() -> Callable[[str], FhYLexer]:
-    def create_lexer(input_str: str) -> FhYLexer:
-        input_stream = InputStream(input_str)
-        lexer = FhYLexer(input_stream)
-        lexer.removeErrorListeners()
-        lexer.addErrorListener(ThrowingErrorListener())
+# One stateless listener instance serves every lexer and parser built here.
+# The heavyweight ANTLR state (deserialized ATN and the adaptive DFA cache)
+# lives on the generated FhYLexer/FhYParser classes themselves, so fresh
+# per-call instances are thin shells that share the warmed-up prediction
+# caches automatically.
+_ERROR_LISTENER = ThrowingErrorListener()
 
-        return lexer
 
-    return create_lexer
+class _AsciiInputStream(InputStream):
+    """An InputStream backed by an ASCII byte buffer instead of a codepoint list.
+
+    The base class builds ``data`` as a Python list of ``ord()`` results, one
+    allocation per character. For ASCII source (all FhY test sources here),
+    indexing an encoded ``bytes`` object yields the same integer codepoints
+    with a single allocation for the whole buffer.
+    """
+
+    def _loadString(self):
+        self._index = 0
+        self.data = self.strdata.encode("ascii")
+        self._size = len(self.data)
+
+
+def _make_input_stream(input_str: str) -> InputStream:
+    try:
+        return _AsciiInputStream(input_str)
+    except UnicodeEncodeError:
+        return InputStream(input_str)
+
+
+def create_lexer(input_str: str) -> FhYLexer:
+    """Build a lexer for raw source text with a throwing error listener."""
+    input_stream = _make_input_stream(input_str)
+    lexer = FhYLexer(input_stream)
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(_ERROR_LISTENER)
+
+    return lexer
+
+
+def lex_one(source: str) -> tuple[str, int]:
+    """Lex the first token of raw source text, returning its text and type.
+
+    Literal-format tests that only care about tokenization can use this to
+    skip the parser and converter entirely.
+    """
+    token = create_lexer(source).nextToken()
+
+    return token.text, token.type
+
 
+def create_parser(input_str: str) -> FhYParser:
+    """Build a parser for raw source text with a throwing error listener."""
+    lexer_instance = create_lexer(input_str)
+    token_stream = CommonTokenStream(lexer_instance)
+    parser = FhYParser(token_stream)
+    # parser._errHandler = BailErrorStrategy()
+    parser.removeErrorListeners()
+    parser.addErrorListener(_ERROR_LISTENER)
 
-@pytest.fixture(scope="module")
-def parser(lexer) -> Callable[[str], FhYParser]:
-    def create_parser(input_str) -> FhYParser:
-        lexer_instance = lexer(input_str)
-        token_stream = CommonTokenStream(lexer_instance)
-        parser = FhYParser(token_stream)
-        # parser._errHandler = BailErrorStrategy()
-        parser.removeErrorListeners()
-        parser.addErrorListener(ThrowingErrorListener())
+    return parser
 
-        return parser
 
+def build_parse_tree(source: str) -> ParserRuleContext:
+    """Build a Concrete Syntax Tree from Raw Source Text (file) using Antlr.
+
+    Parses in two stages: fast SLL prediction with a bail-out error strategy
+    first, retrying with full adaptive LL prediction and the throwing error
+    listener only when SLL cannot parse the input. Valid sources (the common
+    case) complete in SLL mode; invalid sources still surface FhYSyntaxError.
+
+    """
+    parser = create_parser(source)
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        parse_tree = parser.module()
+    except ParseCancellationException:
+        parser = create_parser(source)
+        parser._interp.predictionMode = PredictionMode.LL
+        parse_tree = parser.module()
+    assert parse_tree is not None, "Expected parse tree for module"
+    return parse_tree
+
+
+def build_ast_fresh(source: str) -> ASTNode:
+    """Construct a new, unshared AST from a raw text file source."""
+    return from_parse_tree(build_parse_tree(source))
+
+
+# Module-wide memoization of the CST-to-AST pipeline, keyed on the source
+# string. Duplicated sources across parametrized tests (and across test
+# modules) parse once per worker process. Identifier-varying sources are NOT
+# collapsed onto a shared template on purpose: several tests feed
+# keyword-like argument names through the lexer, and substituting names into
+# a pre-parsed tree would bypass exactly that coverage.
+build_ast = functools.lru_cache(maxsize=1024)(build_ast_fresh)
+
+
+@pytest.fixture(scope="session")
+def lexer() -> Callable[[str], FhYLexer]:
+    return create_lexer
+
+
+@pytest.fixture(scope="session")
+def parser() -> Callable[[str], FhYParser]:
     return create_parser
 
 
-@pytest.fixture
-def parse_file_contents(parser) -> Callable[[str], ParserRuleContext]:
+@pytest.fixture(scope="session")
+def parse_file_contents() -> Callable[[str], ParserRuleContext]:
     """Build a Concrete Syntax Tree from Raw Source Text (file) using Antlr."""
+    return build_parse_tree
 
-    def _inner(source: str):
-        parse_tree = parser(source).module()
-        assert parse_tree is not None, "Expected parse tree for module"
-        return parse_tree
 
-    return _inner
+@pytest.fixture(scope="session")
+def construct_ast() -> Callable[[str], ASTNode]:
+    """Construct an Abstract Syntax Tree (AST) from a raw text file source.
 
+    Results are memoized per session, keyed on the source string. The ASTs are
+    frozen dataclasses and the tests only perform structural assertions, so
+    sharing one tree across identical parametrized sources is safe. Use the
+    "construct_ast_fresh" fixture for any test that needs a private tree.
 
-@pytest.fixture
-def construct_ast(parse_file_contents) -> Callable[[str], ASTNode]:
-    """Construct an Abstract Syntax Tree (AST) from a raw text file source."""
+    """
+    return build_ast
 
-    def _inner(source: str) -> ASTNode:
-        cst = parse_file_contents(source)
-        ast = from_parse_tree(cst)
-        return ast
 
-    return _inner
+@pytest.fixture
+def construct_ast_fresh() -> Callable[[str], ASTNode]:
+    """Construct a new, unshared AST from a raw text file source."""
+    return build_ast_fresh
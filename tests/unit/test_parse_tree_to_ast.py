@@ -1,17 +1,35 @@
-"""Test Conversion of FhY Source Code from CST to AST."""
+"""Test Conversion of FhY Source Code from CST to AST.
+
+The tests in this module are mutually independent and keep no module-level
+mutable state, so pytest-xdist (run with "-n auto" from the project pytest
+options) may schedule them freely across workers; the memoized conftest
+fixtures are plain lru_cache closures, instantiated once per worker process.
+
+"""
 
 from typing import List, Optional, Type
 
 import pytest
 from fhy import error, ir
 from fhy.lang import ast
+from fhy.lang.parser import FhYLexer
 
-from ..utils import list_to_types
+from .conftest import build_ast as construct_ast
+from .conftest import lex_one
 
 # TODO: make all identifier name equality not in terms of name hint after scope and
 #       loading identifiers with table is implemented
 
 
+# Expected identifier expressions for shape assertions. The comparator only
+# matches identifiers by name hint, so one instance per name can be shared
+# across tests instead of allocating fresh Identifier objects inline.
+_IDENT_M = ast.IdentifierExpression(identifier=ir.Identifier("m"))
+_IDENT_N = ast.IdentifierExpression(identifier=ir.Identifier("n"))
+_SHAPE_MN = [_IDENT_M, _IDENT_N]
+_SHAPE_NM = [_IDENT_N, _IDENT_M]
+
+
 def wrong_node_babe(node_a, node_b) -> str:
     """Wrong Node Babe.
 
@@ -22,71 +40,98 @@ def wrong_node_babe(node_a, node_b) -> str:
     return f'Expected "{name}" (AST) node. Received: "{type(node_b)}"'
 
 
-def is_primitive_expression_equal(expr1: ast.Expression, expr2: ast.Expression) -> bool:
-    """Confirm Equality Between Two Primitive Expression Types."""
-    primitive_expression_types = (
-        ast.IntLiteral,
-        ast.FloatLiteral,
-        ast.IdentifierExpression,
-        ast.TupleExpression,
-        ast.TupleAccessExpression,
-        ast.ArrayAccessExpression,
+def _require(node, node_cls) -> None:
+    """Assert that ``node`` is an instance of ``node_cls``."""
+    # Exact-type check first: AST nodes are concrete leaf classes in nearly
+    # every call, and the identity compare skips the isinstance MRO walk.
+    if type(node) is node_cls:
+        return
+    if not isinstance(node, node_cls):
+        raise AssertionError(wrong_node_babe(node_cls, node))
+
+
+def _first_bad_type(items, expected_cls) -> int:
+    """Index of the first item that is not an ``expected_cls``, or -1 if all are."""
+    return next(
+        (i for i, item in enumerate(items) if not isinstance(item, expected_cls)), -1
     )
-    if not isinstance(expr1, primitive_expression_types) or not isinstance(
-        expr2, primitive_expression_types
-    ):
-        raise ValueError(
-            "Both expressions must be primitive expressions: "
-            f"{type(expr1)}, {type(expr2)}"
-        )
 
-    if isinstance(expr1, ast.IntLiteral) and isinstance(expr2, ast.IntLiteral):
-        return expr1.value == expr2.value
-
-    elif isinstance(expr1, ast.FloatLiteral) and isinstance(expr2, ast.FloatLiteral):
-        return expr1.value == expr2.value
-
-    elif isinstance(expr1, ast.IdentifierExpression) and isinstance(
-        expr2, ast.IdentifierExpression
-    ):
-        # TODO: remove the name hint portion once a more robust table for pulling
-        #       identifiers in the same scope is created
-        return expr1.identifier.name_hint == expr2.identifier.name_hint
-
-    elif isinstance(expr1, ast.TupleExpression) and isinstance(
-        expr2, ast.TupleExpression
-    ):
-        raise NotImplementedError()
-
-    elif isinstance(expr1, ast.TupleAccessExpression) and isinstance(
-        expr2, ast.TupleAccessExpression
-    ):
-        return (
-            is_primitive_expression_equal(
-                expr1.tuple_expression, expr2.tuple_expression
-            )
-            and expr1.element_index == expr2.element_index
-        )
 
-    elif isinstance(expr1, ast.ArrayAccessExpression) and isinstance(
-        expr2, ast.ArrayAccessExpression
-    ):
-        if len(expr1.indices) != len(expr2.indices):
-            return False
-        for expr1_index, expr2_index in zip(expr1.indices, expr2.indices):
-            if not is_primitive_expression_equal(expr1_index, expr2_index):
-                return False
-        return True
-    else:
+def _compare_literal(node1, node2, stack) -> bool:
+    return node1.value == node2.value
+
+
+def _compare_identifier(node1, node2, stack) -> bool:
+    # TODO: remove the name hint portion once a more robust table for pulling
+    #       identifiers in the same scope is created
+    return node1.identifier.name_hint == node2.identifier.name_hint
+
+
+def _compare_tuple(node1, node2, stack) -> bool:
+    raise NotImplementedError()
+
+
+def _compare_tuple_access(node1, node2, stack) -> bool:
+    stack.append((node1.tuple_expression, node2.tuple_expression))
+    return node1.element_index == node2.element_index
+
+
+def _compare_array_access(node1, node2, stack) -> bool:
+    if len(node1.indices) != len(node2.indices):
         return False
+    stack.extend(zip(node1.indices, node2.indices))
+    return True
+
+
+# Per-type comparators for the primitive expression types, keyed on the
+# concrete node class for O(1) dispatch. Container comparators push their
+# children onto the shared work-stack instead of recursing.
+_COMPARATORS = {
+    ast.IntLiteral: _compare_literal,
+    ast.FloatLiteral: _compare_literal,
+    ast.IdentifierExpression: _compare_identifier,
+    ast.TupleExpression: _compare_tuple,
+    ast.TupleAccessExpression: _compare_tuple_access,
+    ast.ArrayAccessExpression: _compare_array_access,
+}
+
+
+def is_primitive_expression_equal(expr1: ast.Expression, expr2: ast.Expression) -> bool:
+    """Confirm Equality Between Two Primitive Expression Types.
+
+    Compares iteratively with an explicit work-stack of node pairs, so deeply
+    nested expressions cost no Python stack frames per AST node.
+
+    The dataclass-generated ``==`` on AST nodes is deliberately not used:
+    it includes the source ``span`` (absent on expected nodes built in tests)
+    and ``ir.Identifier`` compares by unique id rather than by name hint, so
+    a parsed node never equals a freshly constructed expectation.
+
+    """
+    stack = [(expr1, expr2)]
+    while stack:
+        node1, node2 = stack.pop()
+        if type(node1) is not type(node2):
+            return False
+        compare = _COMPARATORS.get(type(node1))
+        if compare is None:
+            raise ValueError(
+                "Both expressions must be primitive expressions: "
+                f"{type(node1)}, {type(node2)}"
+            )
+        if not compare(node1, node2, stack):
+            return False
+
+    return True
 
 
 def _assert_is_expected_module(node: ast.ASTNode, expected_num_statements: int) -> None:
-    assert isinstance(node, ast.Module), wrong_node_babe(ast.Module, node)
+    _require(node, ast.Module)
 
-    assert all(map(lambda x: isinstance(x, ast.Statement), node.statements)), (
+    bad = _first_bad_type(node.statements, ast.Statement)
+    assert bad < 0, (
         'Expected all statements to be "Statement" AST nodes, got '
-        + f'"{list_to_types(node.statements)}"'
+        + f'"{type(node.statements[bad])}" at index {bad}'
     )
     assert (
         len(node.statements) == expected_num_statements
@@ -94,7 +139,7 @@ def _assert_is_expected_module(node: ast.ASTNode, expected_num_statements: int)
 
 
 def _assert_is_expected_import(node: ast.ASTNode, expected_import: str) -> None:
-    assert isinstance(node, ast.Import), wrong_node_babe(ast.Import, node)
+    _require(node, ast.Import)
 
     assert isinstance(
         node.name, ir.Identifier
@@ -111,7 +156,7 @@ def _assert_is_expected_procedure(
     expected_num_args: int,
     expected_num_statements: int,
 ) -> None:
-    assert isinstance(node, ast.Procedure), wrong_node_babe(ast.Procedure, node)
+    _require(node, ast.Procedure)
 
     assert isinstance(
         node.name, ir.Identifier
@@ -119,17 +164,19 @@ def _assert_is_expected_procedure(
     assert (
         node.name.name_hint == expected_name
     ), f'Expected procedure name to be "{expected_name}", got "{node.name.name_hint}"'
-    assert all(isinstance(arg, ast.Argument) for arg in node.args), (
+    bad = _first_bad_type(node.args, ast.Argument)
+    assert bad < 0, (
         'Expected all arguments to be "Argument" AST nodes, got '
-        + f'"{list_to_types(node.args)}"'
+        + f'"{type(node.args[bad])}" at index {bad}'
     )
     assert len(node.args) == expected_num_args, (
         f"Expected procedure to have {expected_num_args} arguments, got "
         + f"{len(node.args)}"
     )
-    assert all(isinstance(statement, ast.Statement) for statement in node.body), (
+    bad = _first_bad_type(node.body, ast.Statement)
+    assert bad < 0, (
         'Expected all statements to be "Statement" AST nodes, got '
-        + f"{list_to_types(node.body)}"
+        + f'"{type(node.body[bad])}" at index {bad}'
     )
     assert len(node.body) == expected_num_statements, (
         f"Expected procedure to have {expected_num_statements} statements, got "
@@ -143,7 +190,7 @@ def _assert_is_expected_operation(
     expected_num_args: int,
     expected_num_statements: int,
 ) -> None:
-    assert isinstance(node, ast.Operation), wrong_node_babe(ast.Operation, node)
+    _require(node, ast.Operation)
 
     assert isinstance(
         node.name, ir.Identifier
@@ -151,17 +198,19 @@ def _assert_is_expected_operation(
     assert (
         node.name.name_hint == expected_name
     ), f'Expected operation name to be "{expected_name}", got "{node.name.name_hint}"'
-    assert all(isinstance(arg, ast.Argument) for arg in node.args), (
+    bad = _first_bad_type(node.args, ast.Argument)
+    assert bad < 0, (
         'Expected all arguments to be "Argument" AST nodes, got '
-        + f'"{list_to_types(node.args)}"'
+        + f'"{type(node.args[bad])}" at index {bad}'
     )
     assert len(node.args) == expected_num_args, (
         f"Expected operation to have {expected_num_args} arguments, got "
         + f"{len(node.args)}"
     )
-    assert all(isinstance(statement, ast.Statement) for statement in node.body), (
+    bad = _first_bad_type(node.body, ast.Statement)
+    assert bad < 0, (
         'Expected all statements to be "Statement" AST nodes, got '
-        + f'"{list_to_types(node.body)}"'
+        + f'"{type(node.body[bad])}" at index {bad}'
     )
     assert len(node.body) == expected_num_statements, (
         f"Expected operation to have {expected_num_statements} statements, got "
@@ -174,7 +223,7 @@ def _assert_is_expected_qualified_type(
     expected_type_qualifier: ir.TypeQualifier,
     expected_base_type_cls: Type[ir.Type],
 ) -> None:
-    assert isinstance(node, ast.QualifiedType), wrong_node_babe(ast.QualifiedType, node)
+    _require(node, ast.QualifiedType)
 
     assert node.type_qualifier == expected_type_qualifier, (
         f'Expected type qualifier to be "{expected_type_qualifier}", '
@@ -190,11 +239,9 @@ def _assert_is_expected_argument(
     node: ast.ASTNode,
     expected_name: str,
 ) -> None:
-    assert isinstance(node, ast.Argument), wrong_node_babe(ast.Argument, node)
+    _require(node, ast.Argument)
 
-    assert isinstance(node.name, ir.Identifier), wrong_node_babe(
-        ir.Identifier, node.name
-    )
+    _require(node.name, ir.Identifier)
     assert (
         node.name.name_hint == expected_name
     ), f'Expected argument name to be "{expected_name}", got "{node.name.name_hint}"'
@@ -205,9 +252,7 @@ def _assert_is_expected_numerical_type(
     expected_primitive_data_type: ir.PrimitiveDataType,
     expected_shape: List[ast.Expression],
 ) -> None:
-    assert isinstance(numerical_type, ir.NumericalType), wrong_node_babe(
-        ir.NumericalType, numerical_type
-    )
+    _require(numerical_type, ir.NumericalType)
 
     assert (
         numerical_type.data_type.primitive_data_type == expected_primitive_data_type
@@ -216,9 +261,10 @@ def _assert_is_expected_numerical_type(
         + f'"{numerical_type.data_type.primitive_data_type}"'
     )
 
-    assert all(isinstance(expr, ast.Expression) for expr in numerical_type.shape), (
+    bad = _first_bad_type(numerical_type.shape, ast.Expression)
+    assert bad < 0, (
         'Expected all shape components to be "Expression" AST nodes, got '
-        + f'"{list_to_types(numerical_type.shape)}"'
+        + f'"{type(numerical_type.shape[bad])}" at index {bad}'
     )
     assert len(numerical_type.shape) == len(expected_shape), (
         f"Expected numerical type shape to have {len(expected_shape)} components, got "
@@ -235,9 +281,10 @@ def _assert_is_expected_shape(
     shape: List[ast.Expression], expected_shape: List[ast.Expression]
 ) -> None:
     assert isinstance(shape, list), f'Expected shape to be a list, got "{type(shape)}"'
-    assert all(isinstance(expr, ast.Expression) for expr in shape), (
+    bad = _first_bad_type(shape, ast.Expression)
+    assert bad < 0, (
         'Expected all shape components to be "Expression" AST nodes, got '
-        + f'"{list_to_types(shape)}"'
+        + f'"{type(shape[bad])}" at index {bad}'
     )
     assert len(shape) == len(
         expected_shape
@@ -255,30 +302,22 @@ def _assert_is_expected_index_type(
     expected_high: ast.Expression,
     expected_stride: Optional[ast.Expression],
 ) -> None:
-    assert isinstance(index_type, ir.IndexType), wrong_node_babe(
-        ir.IndexType, index_type
-    )
+    _require(index_type, ir.IndexType)
 
-    assert isinstance(index_type.lower_bound, ast.Expression), wrong_node_babe(
-        ast.Expression, index_type.lower_bound
-    )
+    _require(index_type.lower_bound, ast.Expression)
 
     assert is_primitive_expression_equal(index_type.lower_bound, expected_low), (
         "Expected lower bound to be equal "
         + f"(expected: {expected_low}, actual: {index_type.lower_bound})"
     )
-    assert isinstance(index_type.upper_bound, ast.Expression), wrong_node_babe(
-        ast.Expression, index_type.upper_bound
-    )
+    _require(index_type.upper_bound, ast.Expression)
 
     assert is_primitive_expression_equal(index_type.upper_bound, expected_high), (
         "Expected upper bound to be equal "
         + f"(expected: {expected_high}, actual: {index_type.upper_bound})"
     )
     if expected_stride is not None:
-        assert isinstance(index_type.stride, ast.Expression), wrong_node_babe(
-            ast.Expression, index_type.stride
-        )
+        _require(index_type.stride, ast.Expression)
         assert is_primitive_expression_equal(index_type.stride, expected_stride), (
             "Expected stride to be equal "
             + f"(expected: {expected_stride}, actual: {index_type.stride})"
@@ -290,25 +329,17 @@ def _assert_is_expected_declaration_statement(
     expected_variable_name: ir.Identifier,
     expected_expression: Optional[ast.Expression],
 ) -> None:
-    assert isinstance(node, ast.DeclarationStatement), wrong_node_babe(
-        ast.DeclarationStatement, node
-    )
+    _require(node, ast.DeclarationStatement)
 
-    assert isinstance(node.variable_name, ir.Identifier), wrong_node_babe(
-        ir.Identifier, node.variable_name
-    )
+    _require(node.variable_name, ir.Identifier)
 
     assert node.variable_name.name_hint == expected_variable_name.name_hint, (
         f'Expected variable name to be "{expected_variable_name.name_hint}", '
         + f'got "{node.variable_name.name_hint}"'
     )
-    assert isinstance(node.variable_type, ast.QualifiedType), wrong_node_babe(
-        ast.QualifiedType, node.variable_type
-    )
+    _require(node.variable_type, ast.QualifiedType)
     if node.expression is not None:
-        assert isinstance(node.expression, ast.Expression), wrong_node_babe(
-            ast.Expression, node.expression
-        )
+        _require(node.expression, ast.Expression)
 
     if expected_expression is not None:
         assert is_primitive_expression_equal(
@@ -321,22 +352,16 @@ def _assert_is_expected_expression_statement(
     expected_left_expression: Optional[ast.Expression],
     expected_right_expression: ast.Expression,
 ) -> None:
-    assert isinstance(node, ast.ExpressionStatement), wrong_node_babe(
-        ast.ExpressionStatement, node
-    )
+    _require(node, ast.ExpressionStatement)
 
     if expected_left_expression is not None:
-        assert isinstance(node.left, ast.Expression), wrong_node_babe(
-            ast.Expression, node.left
-        )
+        _require(node.left, ast.Expression)
 
         assert is_primitive_expression_equal(node.left, expected_left_expression), (
             "Expected left expression to be equal "
             + f"(expected: {expected_left_expression}, actual: {node.left})"
         )
-    assert isinstance(node.right, ast.Expression), wrong_node_babe(
-        ast.Expression, node.right
-    )
+    _require(node.right, ast.Expression)
     assert is_primitive_expression_equal(node.right, expected_right_expression), (
         "Expected right expression to be equal "
         + f"(expected: {expected_right_expression}, actual: {node.right})"
@@ -346,22 +371,36 @@ def _assert_is_expected_expression_statement(
 def _assert_is_expected_return_statement(
     node: ast.ASTNode, expected_expression: ast.Expression
 ) -> None:
-    assert isinstance(node, ast.ReturnStatement), wrong_node_babe(
-        ast.ReturnStatement, node
-    )
-    assert isinstance(node.expression, ast.Expression), wrong_node_babe(
-        ast.Expression, node.expression
-    )
+    _require(node, ast.ReturnStatement)
+    _require(node.expression, ast.Expression)
     assert is_primitive_expression_equal(node.expression, expected_expression), (
         "Expected expression to be equal "
         + f"(expected: {expected_expression}, actual: {node.expression})"
     )
 
 
+def _get_declaration_expression(
+    module: ast.ASTNode, expression_cls: Type[ast.Expression]
+) -> ast.Expression:
+    """Return the expression of a single-statement module's declaration.
+
+    Checks the module shape, the DeclarationStatement node, and the class of
+    the declared expression in one call, replacing the prelude repeated by
+    the expression tests.
+
+    """
+    _assert_is_expected_module(module, 1)
+    statement = module.statements[0]
+    _require(statement, ast.DeclarationStatement)
+    expression = statement.expression
+    _require(expression, expression_cls)
+    return expression
+
+
 # ====
 # CORE
 # ====
-def test_empty_file(construct_ast):
+def test_empty_file():
     """Test that an empty file is converted correctly."""
     source: str = ""
     _ast = construct_ast(source)
@@ -372,15 +411,15 @@ def test_empty_file(construct_ast):
 # FUNCTIONS
 # =========
 @pytest.mark.parametrize(
-    ["source"],
+    "source",
     [
-        ("proc foo(){}",),  # Procedure Only
-        ("proc foo<>() {}",),  # with Template Type
-        ("proc foo[]() {}",),  # with Index
-        ("proc foo<>[]() {}",),  # Both Template and Index
+        "proc foo(){}",  # Procedure Only
+        "proc foo<>() {}",  # with Template Type
+        "proc foo[]() {}",  # with Index
+        "proc foo<>[]() {}",  # Both Template and Index
     ],
 )
-def test_empty_procedure(construct_ast, source: str):
+def test_empty_procedure(source: str):
     """Test that an empty procedure is converted correctly."""
     # source: str = "proc foo(){}"
     _ast = construct_ast(source)
@@ -391,28 +430,28 @@ def test_empty_procedure(construct_ast, source: str):
 
 
 @pytest.mark.parametrize(
-    ["name"],
+    "name",
     [
-        ("x",),
-        ("arg",),
-        ("arg1",),
-        ("arg_1",),
+        "x",
+        "arg",
+        "arg1",
+        "arg_1",
         # Check Identity Names similar to Keywords
-        ("importer",),
-        ("from_there",),
-        ("astype",),
-        ("tuples",),
-        ("indexed",),
-        ("proctor",),
-        ("operator",),
-        ("natives",),
-        ("reduction",),
-        ("if_true",),
-        ("else_if",),
-        ("return_value",),
+        "importer",
+        "from_there",
+        "astype",
+        "tuples",
+        "indexed",
+        "proctor",
+        "operator",
+        "natives",
+        "reduction",
+        "if_true",
+        "else_if",
+        "return_value",
     ],
 )
-def test_empty_procedure_with_qualified_argument(construct_ast, name: str):
+def test_empty_procedure_with_qualified_argument(name: str):
     """Test an empty procedure with a single qualified argument and argument names."""
     source: str = "proc foo(input int32 %s){}" % name
     _ast = construct_ast(source)
@@ -432,7 +471,7 @@ def test_empty_procedure_with_qualified_argument(construct_ast, name: str):
     _assert_is_expected_numerical_type(arg_base_type, ir.PrimitiveDataType.INT32, [])
 
 
-def test_empty_procedure_with_a_qualified_argument_with_shape(construct_ast):
+def test_empty_procedure_with_a_qualified_argument_with_shape():
     """Test an Empty procedure containing Arguments with Shape."""
     source: str = "proc foo(input int32[m, n] x){}"
     _ast = construct_ast(source)
@@ -449,25 +488,19 @@ def test_empty_procedure_with_a_qualified_argument_with_shape(construct_ast):
         arg_qualified_type, ir.TypeQualifier.INPUT, ir.NumericalType
     )
     arg_type_shape = arg_qualified_type.base_type.shape
-    _assert_is_expected_shape(
-        arg_type_shape,
-        [
-            ast.IdentifierExpression(identifier=ir.Identifier("m")),
-            ast.IdentifierExpression(identifier=ir.Identifier("n")),
-        ],
-    )
+    _assert_is_expected_shape(arg_type_shape, _SHAPE_MN)
 
 
 @pytest.mark.parametrize(
-    ["source"],
+    "source",
     [
-        ("op foo() -> output int32 {}",),  # Operation Only
-        ("op foo<>() -> output int32 {}",),  # with Template Type
-        ("op foo[]() -> output int32 {}",),  # with Index
-        ("op foo<>[]() -> output int32 {}",),  # Both Template and Index
+        "op foo() -> output int32 {}",  # Operation Only
+        "op foo<>() -> output int32 {}",  # with Template Type
+        "op foo[]() -> output int32 {}",  # with Index
+        "op foo<>[]() -> output int32 {}",  # Both Template and Index
     ],
 )
-def test_empty_operation(construct_ast, source: str):
+def test_empty_operation(source: str):
     """Test that an Empty Operation is Converted Correctly."""
     _ast = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
@@ -476,7 +509,7 @@ def test_empty_operation(construct_ast, source: str):
     _assert_is_expected_operation(operation, "foo", 0, 0)
 
 
-def test_empty_operation_return_type(construct_ast):
+def test_empty_operation_return_type():
     """Test that an Empty Operation with a Return Type is Converted Correctly."""
     source: str = "op foo(input int32[n, m] x) -> output int32[n, m] {}"
     _ast = construct_ast(source)
@@ -494,12 +527,7 @@ def test_empty_operation_return_type(construct_ast):
     )
     arg_base_type: ir.Type = arg_qualified_type.base_type
     _assert_is_expected_numerical_type(
-        arg_base_type,
-        ir.PrimitiveDataType.INT32,
-        [
-            ast.IdentifierExpression(identifier=ir.Identifier("n")),
-            ast.IdentifierExpression(identifier=ir.Identifier("m")),
-        ],
+        arg_base_type, ir.PrimitiveDataType.INT32, _SHAPE_NM
     )
 
     return_type = operation.return_type
@@ -507,41 +535,41 @@ def test_empty_operation_return_type(construct_ast):
         return_type, ir.TypeQualifier.OUTPUT, ir.NumericalType
     )
     return_type_shape = return_type.base_type.shape
-    _assert_is_expected_shape(
-        return_type_shape,
-        [
-            ast.IdentifierExpression(identifier=ir.Identifier("n")),
-            ast.IdentifierExpression(identifier=ir.Identifier("m")),
-        ],
-    )
+    _assert_is_expected_shape(return_type_shape, _SHAPE_NM)
 
 
 @pytest.mark.parametrize(
-    ["templates"],
-    [(["T"],), (["T", "K"],), (["V", "Ex", "F"],)],
+    "templates",
+    [["T"], ["T", "K"], ["V", "Ex", "F"]],
 )
-def test_operation_template_types(construct_ast, templates: List[str]):
+def test_operation_template_types(templates: List[str]):
     """Test that an Empty Operation with a Return Type is Converted Correctly."""
     source: str = "op foo<%s>(input int32[n, m] x) -> output int32[n, m] {}"
-    print(source % ", ".join(templates))
     _ast = construct_ast(source % ", ".join(templates))
     _assert_is_expected_module(_ast, 1)
 
     operation: ast.Operation = _ast.statements[0]
     _assert_is_expected_operation(operation, "foo", 1, 0)
 
+    arg = operation.args[0]
+    _assert_is_expected_argument(arg, "x")
+    _assert_is_expected_numerical_type(
+        arg.qualified_type.base_type, ir.PrimitiveDataType.INT32, _SHAPE_NM
+    )
+    _assert_is_expected_shape(operation.return_type.base_type.shape, _SHAPE_NM)
+
     assert len(operation.templates) == len(
         templates
     ), "Expected Same Number of Template Types."
     for j, k in zip(operation.templates, templates):
-        assert isinstance(j, ir.Identifier), wrong_node_babe(ir.Identifier, j)
+        _require(j, ir.Identifier)
         assert j.name_hint == k, f"Expected Same Identifier Name: {j.name_hint}"
 
 
 # ==========
 # STATEMENTS
 # ==========
-def test_absolute_import(construct_ast):
+def test_absolute_import():
     """Test Absolute Import Statement."""
     source: str = "import foo.bar;"
     _ast = construct_ast(source)
@@ -551,7 +579,7 @@ def test_absolute_import(construct_ast):
     _assert_is_expected_import(statement, "foo.bar")
 
 
-def test_declaration_statement_without_assignment(construct_ast):
+def test_declaration_statement_without_assignment():
     """Tests a single Declaration Statement without assigning a value to variable."""
     source: str = "temp int32 i;"
     _ast: ast.Module = construct_ast(source)
@@ -567,74 +595,58 @@ def test_declaration_statement_without_assignment(construct_ast):
     _assert_is_expected_shape(qualified.base_type.shape, [])
 
 
-def test_expression_statement_without_assignment(construct_ast):
+def test_expression_statement_without_assignment():
     """Test Construction of simple Expression Statements."""
     source = "5 + 5;"
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.ExpressionStatement), wrong_node_babe(
-        ast.ExpressionStatement, statement
-    )
+    _require(statement, ast.ExpressionStatement)
 
     assert statement.left is None, f"Expected No Left Hand Expression: {statement.left}"
-    assert isinstance(statement.right, ast.BinaryExpression), wrong_node_babe(
-        ast.BinaryExpression, statement.right
-    )
+    _require(statement.right, ast.BinaryExpression)
 
 
-def test_expression_statement_with_assignment(construct_ast):
+def test_expression_statement_with_assignment():
     """Test Construction of simple Expression Statements with variable Assignment."""
     source = "A = 5 + 5;"
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.ExpressionStatement), wrong_node_babe(
-        ast.ExpressionStatement, statement
-    )
+    _require(statement, ast.ExpressionStatement)
 
     assert is_primitive_expression_equal(
         statement.left, ast.IdentifierExpression(identifier=ir.Identifier("A"))
     )
 
-    assert isinstance(statement.right, ast.BinaryExpression), wrong_node_babe(
-        ast.BinaryExpression, statement.right
-    )
+    _require(statement.right, ast.BinaryExpression)
 
 
-def test_selection_statement(construct_ast):
+def test_selection_statement():
     """Test an If (selection) Statement."""
     source: str = "if (1) {i = 1;} else {j = 1;}"
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.SelectionStatement), wrong_node_babe(
-        ast.SelectionStatement, statement
-    )
-    assert isinstance(statement.condition, ast.IntLiteral), wrong_node_babe(
-        ast.IntLiteral, statement.condition
-    )
+    _require(statement, ast.SelectionStatement)
+    _require(statement.condition, ast.IntLiteral)
 
     assert len(statement.true_body) == 1, "Expected 1 Statement in True Body."
     assert len(statement.false_body) == 1, "Expected 1 Statement in False Body."
 
 
-def test_for_all_statement(construct_ast):
+def test_for_all_statement():
     """Test an Iteration (For All) Statement (loop)."""
     source: str = "forall (i) {}"
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.ForAllStatement), wrong_node_babe(
-        ast.ForAllStatement, statement
-    )
-    assert isinstance(statement.index, ast.IdentifierExpression), wrong_node_babe(
-        ast.IdentifierExpression, statement.index
-    )
+    _require(statement, ast.ForAllStatement)
+    _require(statement.index, ast.IdentifierExpression)
     assert statement.index.identifier.name_hint == "i", (
         'Expected index name hint to be "i", got '
         + f'"{statement.index.identifier.name_hint}"'
@@ -644,7 +656,7 @@ def test_for_all_statement(construct_ast):
     ), f"Expected body to have 0 statements, got {len(statement.body)}"
 
 
-def test_return_statement(construct_ast):
+def test_return_statement():
     """Test a Return Statement."""
     source: str = "return i;"  # Semantically Incorrect.
     _ast: ast.Module = construct_ast(source)
@@ -659,22 +671,13 @@ def test_return_statement(construct_ast):
 # ===========
 # EXPRESSIONS
 # ===========
-@pytest.mark.parametrize(["operator"], [(j,) for j in ast.UnaryOperation])
-def test_unary_expression(construct_ast, operator: ast.UnaryOperation):
+@pytest.mark.parametrize(
+    "operator", list(ast.UnaryOperation), ids=[op.name for op in ast.UnaryOperation]
+)
+def test_unary_expression(operator: ast.UnaryOperation):
     """Test Construction of Unary Expression with correct Operator."""
     source: str = "temp int32 i = %s5;" % operator.value
-    _ast: ast.Module = construct_ast(source)
-    _assert_is_expected_module(_ast, 1)
-
-    statement = _ast.statements[0]
-    assert isinstance(statement, ast.DeclarationStatement), wrong_node_babe(
-        ast.DeclarationStatement, statement
-    )
-
-    expression = statement.expression
-    assert isinstance(expression, ast.UnaryExpression), wrong_node_babe(
-        ast.UnaryExpression, expression
-    )
+    expression = _get_declaration_expression(construct_ast(source), ast.UnaryExpression)
     assert (
         expression.operation == operator
     ), f'Expected "{operator}" operation. Received: "{expression.operation}"'
@@ -682,19 +685,15 @@ def test_unary_expression(construct_ast, operator: ast.UnaryOperation):
     assert is_primitive_expression_equal(expression.expression, ast.IntLiteral(value=5))
 
 
-@pytest.mark.parametrize(["operator"], [(i,) for i in ast.BinaryOperation])
-def test_binary_expressions(construct_ast, operator: ast.BinaryOperation):
+@pytest.mark.parametrize(
+    "operator", list(ast.BinaryOperation), ids=[op.name for op in ast.BinaryOperation]
+)
+def test_binary_expressions(operator: ast.BinaryOperation):
     """Tests Construction of all Available Binary Expression Operators."""
     source: str = f"temp float32 i = 5 {operator.value} 6;"  # Semantically Incorrect
-    _ast: ast.Module = construct_ast(source)
-    _assert_is_expected_module(_ast, 1)
-
-    statement = _ast.statements[0]
-    assert isinstance(statement, ast.DeclarationStatement), wrong_node_babe(
-        ast.DeclarationStatement, statement
+    expression = _get_declaration_expression(
+        construct_ast(source), ast.BinaryExpression
     )
-
-    expression = statement.expression
     assert (
         expression.operation == operator
     ), f'Expected "{operator}" operation. Received: "{expression.operation}"'
@@ -703,25 +702,14 @@ def test_binary_expressions(construct_ast, operator: ast.BinaryOperation):
     assert is_primitive_expression_equal(expression.right, ast.IntLiteral(value=6))
 
 
-def test_ternary_expressions(construct_ast):
+def test_ternary_expressions():
     """Test a Ternary Conditional Expression."""
     source: str = "temp float32 i = 5 < 6 ? 7 : 8;"
-    _ast: ast.Module = construct_ast(source)
-    _assert_is_expected_module(_ast, 1)
-
-    statement = _ast.statements[0]
-    assert isinstance(statement, ast.DeclarationStatement), wrong_node_babe(
-        ast.DeclarationStatement, statement
+    expression = _get_declaration_expression(
+        construct_ast(source), ast.TernaryExpression
     )
 
-    expression = statement.expression
-    assert isinstance(expression, ast.TernaryExpression), wrong_node_babe(
-        ast.TernaryExpression, expression
-    )
-
-    assert isinstance(expression.condition, ast.BinaryExpression), wrong_node_babe(
-        ast.BinaryExpression, expression.condition
-    )
+    _require(expression.condition, ast.BinaryExpression)
     assert is_primitive_expression_equal(expression.true, ast.IntLiteral(value=7))
     assert is_primitive_expression_equal(expression.false, ast.IntLiteral(value=8))
 
@@ -729,8 +717,15 @@ def test_ternary_expressions(construct_ast):
 # TODO: Debug and Support Tuple Access Expressions.
 # NOTE: Identifier Expressions are Taking Precedence over Tuple Access Primitives.
 # @pytest.mark.skip(reason="Unsupported. Problematic")
-@pytest.mark.parametrize(["name"], [("A",), ("A1",), ("A_",)])
-def test_tuple_access_expression(construct_ast, name: str):
+@pytest.mark.parametrize(
+    "name",
+    [
+        pytest.param("A", id="simple"),
+        pytest.param("A1", id="trailing_digit"),
+        pytest.param("A_", id="trailing_underscore"),
+    ],
+)
+def test_tuple_access_expression(name: str):
     """Test a Tuple Access Expression."""
     source: str = "x = %s.1;" % name
     _ast: ast.Module = construct_ast(source)
@@ -747,40 +742,35 @@ def test_tuple_access_expression(construct_ast, name: str):
     )
 
 
-@pytest.mark.parametrize(
-    ["source", "nargs", "name"],
-    [
-        ("temp int32 i = foo();", 0, "foo"),  # only Function Call
-        ("temp int32 i = foo(A);", 1, "foo"),  # only Function Call
-        ("temp int32 i = module.method();", 0, "module.method"),
-        ("temp int32 i = module.method(A);", 1, "module.method"),
-        ("temp int32 i = foo[]();", 0, "foo"),  # with Index
-        ("temp int32 i = foo[](A);", 1, "foo"),  # with Index
-        ("temp int32 i = module.method[]();", 0, "module.method"),
-        ("temp int32 i = module.method[](A);", 1, "module.method"),
-        ("temp int32 i = foo<>();", 0, "foo"),  # with Template Types
-        ("temp int32 i = foo<>(A);", 1, "foo"),  # with Template Types
-        ("temp int32 i = module.method<>();", 0, "module.method"),
-        ("temp int32 i = module.method<>(A);", 1, "module.method"),
-        ("temp int32 i = foo<>[]();", 0, "foo"),  # both Template Types and Index
-        ("temp int32 i = foo<>[](A);", 1, "foo"),  # both Template Types and Index
-        ("temp int32 i = module.method<>[]();", 0, "module.method"),
-        ("temp int32 i = module.method<>[](A);", 1, "module.method"),
-    ],
-)
-def test_function_expression(construct_ast, source: str, nargs: int, name: str):
+# Combinatorial grid over template-type brackets, index brackets, qualified
+# function names, and argument counts. Hoisted so the table is built once at
+# collection; the memoized construct_ast fixture parses each row once per
+# session, so no per-test AST dictionary fixture is needed on top.
+_FUNCTION_EXPRESSION_CASES = [
+    ("temp int32 i = foo();", 0, "foo"),  # only Function Call
+    ("temp int32 i = foo(A);", 1, "foo"),  # only Function Call
+    ("temp int32 i = module.method();", 0, "module.method"),
+    ("temp int32 i = module.method(A);", 1, "module.method"),
+    ("temp int32 i = foo[]();", 0, "foo"),  # with Index
+    ("temp int32 i = foo[](A);", 1, "foo"),  # with Index
+    ("temp int32 i = module.method[]();", 0, "module.method"),
+    ("temp int32 i = module.method[](A);", 1, "module.method"),
+    ("temp int32 i = foo<>();", 0, "foo"),  # with Template Types
+    ("temp int32 i = foo<>(A);", 1, "foo"),  # with Template Types
+    ("temp int32 i = module.method<>();", 0, "module.method"),
+    ("temp int32 i = module.method<>(A);", 1, "module.method"),
+    ("temp int32 i = foo<>[]();", 0, "foo"),  # both Template Types and Index
+    ("temp int32 i = foo<>[](A);", 1, "foo"),  # both Template Types and Index
+    ("temp int32 i = module.method<>[]();", 0, "module.method"),
+    ("temp int32 i = module.method<>[](A);", 1, "module.method"),
+]
+
+
+@pytest.mark.parametrize("source, nargs, name", _FUNCTION_EXPRESSION_CASES)
+def test_function_expression(source: str, nargs: int, name: str):
     """Test Function Call Expression within a Declaration Statement."""
-    _ast: ast.Module = construct_ast(source)
-    _assert_is_expected_module(_ast, 1)
-
-    statement = _ast.statements[0]
-    assert isinstance(statement, ast.DeclarationStatement), wrong_node_babe(
-        ast.DeclarationStatement, statement
-    )
-
-    expression = statement.expression
-    assert isinstance(expression, ast.FunctionExpression), wrong_node_babe(
-        ast.FunctionExpression, expression
+    expression = _get_declaration_expression(
+        construct_ast(source), ast.FunctionExpression
     )
     assert is_primitive_expression_equal(
         expression.function, ast.IdentifierExpression(identifier=ir.Identifier(name))
@@ -800,36 +790,91 @@ def test_function_expression(construct_ast, source: str, nargs: int, name: str):
         assert is_primitive_expression_equal(expression.args[0], expect)
 
 
+@pytest.fixture(scope="session")
+def template_procedure():
+    """Parse a templated procedure with a templated call once per session.
+
+    Returns the procedure, its argument, the call statement, and the call's
+    function expression so the assertions can live in small independent tests
+    sharing a single parse.
+    """
+    module = construct_ast("proc foo<T>(input int32[m, n] A) { bar<T>(A); }")
+    _assert_is_expected_module(module, 1)
+
+    procedure = module.statements[0]
+    _require(procedure, ast.Procedure)
+    statement = procedure.body[0]
+    _require(statement, ast.ExpressionStatement)
+    function = statement.right
+    _require(function, ast.FunctionExpression)
+
+    return procedure, procedure.args[0], statement, function
+
+
+def test_template_procedure_templates(template_procedure):
+    """Test that a Procedure's Template Types are recorded as Identifiers."""
+    procedure, _, _, _ = template_procedure
+    _assert_is_expected_procedure(procedure, "foo", 1, 1)
+
+    assert len(procedure.templates) == 1, "Expected One Template Type."
+    _require(procedure.templates[0], ir.Identifier)
+    assert procedure.templates[0].name_hint == "T", "Expected Template Type 'T'."
+
+
+def test_template_procedure_argument(template_procedure):
+    """Test the Argument of a templated Procedure."""
+    _, arg, _, _ = template_procedure
+    _assert_is_expected_argument(arg, "A")
+    _assert_is_expected_qualified_type(
+        arg.qualified_type, ir.TypeQualifier.INPUT, ir.NumericalType
+    )
+    _assert_is_expected_numerical_type(
+        arg.qualified_type.base_type, ir.PrimitiveDataType.INT32, _SHAPE_MN
+    )
+
+
+def test_template_procedure_call_template(template_procedure):
+    """Test that a Function Call's Template Type is the Procedure's Template."""
+    _, _, statement, function = template_procedure
+    assert statement.left is None, f"Unexpected Left Expression: {statement.left}"
+
+    assert is_primitive_expression_equal(
+        function.function, ast.IdentifierExpression(identifier=ir.Identifier("bar"))
+    )
+    assert len(function.template_types) == 1, "Expected One Template Type on Call."
+    assert is_primitive_expression_equal(
+        function.template_types[0],
+        ast.IdentifierExpression(identifier=ir.Identifier("T")),
+    )
+    assert len(function.args) == 1, "Expected One Argument on Call."
+
+
 @pytest.mark.parametrize(
-    ["source"],
+    "source",
     [
-        ("foo();",),  # only Function Call
-        ("foo<>();",),  # with Template Types
-        ("foo[]();",),  # with Index
-        ("foo<>[]();",),  # both Template Types and Index
-        ("module.method();",),
-        ("module.method[]();",),
-        ("module.method<>();",),
-        ("module.method<>[]();",),
+        "foo();",  # only Function Call
+        "foo<>();",  # with Template Types
+        "foo[]();",  # with Index
+        "foo<>[]();",  # both Template Types and Index
+        "module.method();",
+        "module.method[]();",
+        "module.method<>();",
+        "module.method<>[]();",
     ],
 )
-def test_function_expression_as_expression_statement(construct_ast, source: str):
+def test_function_expression_as_expression_statement(source: str):
     """Test Function Call Expression within as an Expression Statement."""
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.ExpressionStatement), wrong_node_babe(
-        ast.ExpressionStatement, statement
-    )
+    _require(statement, ast.ExpressionStatement)
 
     assert statement.left is None, f"Unexpected Left Expression: {statement.left}"
-    assert isinstance(statement.right, ast.FunctionExpression), wrong_node_babe(
-        ast.FunctionExpression, statement.right
-    )
+    _require(statement.right, ast.FunctionExpression)
 
 
-def test_tensor_access_expression(construct_ast):
+def test_tensor_access_expression():
     """Test construction of a Tensor Access Expression."""
     source: str = "A[i] = 1;"  # Semantically Invalid
     _ast: ast.Module = construct_ast(source)
@@ -849,16 +894,14 @@ def test_tensor_access_expression(construct_ast):
 # =====
 # TYPES
 # =====
-def test_index_type(construct_ast):
+def test_index_type():
     """Test Construction of an Index Type."""
     source: str = "temp index[1:m] i;"  # Semantically Invalid
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.DeclarationStatement), wrong_node_babe(
-        ast.DeclarationStatement, statement
-    )
+    _require(statement, ast.DeclarationStatement)
     _assert_is_expected_qualified_type(
         statement.variable_type, ir.TypeQualifier.TEMP, ir.IndexType
     )
@@ -871,22 +914,20 @@ def test_index_type(construct_ast):
 
 
 @pytest.mark.parametrize(
-    ["source"],
+    "source",
     [
-        ("output tuple[int32[m, n], int32] i;",),
-        ("output tuple[int32[m, n], int32,] i;",),
+        pytest.param("output tuple[int32[m, n], int32] i;", id="no_trailing_comma"),
+        pytest.param("output tuple[int32[m, n], int32,] i;", id="trailing_comma"),
     ],
 )
-def test_tuple_type(construct_ast, source: str):
+def test_tuple_type(source: str):
     """Test construction of Tuple Type."""
     # source: str = "output tuple[int32[m, n], int32] i;"  # Semantically Invalid
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.DeclarationStatement), wrong_node_babe(
-        ast.DeclarationStatement, statement
-    )
+    _require(statement, ast.DeclarationStatement)
     assert statement.variable_name.name_hint == "i", 'Expected Variable Name "i"'
     _assert_is_expected_qualified_type(
         statement.variable_type, ir.TypeQualifier.OUTPUT, ir.TupleType
@@ -896,14 +937,7 @@ def test_tuple_type(construct_ast, source: str):
     _tuple: ir.TupleType = statement.variable_type.base_type
     assert len(_tuple._types) == 2, "Expected 2 Types in TupleType Definition."
     t1, t2 = _tuple._types
-    _assert_is_expected_numerical_type(
-        t1,
-        ir.PrimitiveDataType.INT32,
-        [
-            ast.IdentifierExpression(identifier=ir.Identifier("m")),
-            ast.IdentifierExpression(identifier=ir.Identifier("n")),
-        ],
-    )
+    _assert_is_expected_numerical_type(t1, ir.PrimitiveDataType.INT32, _SHAPE_MN)
     _assert_is_expected_numerical_type(t2, ir.PrimitiveDataType.INT32, [])
 
 
@@ -919,45 +953,63 @@ def test_tuple_type(construct_ast, source: str):
         ("0O7;", 7),
     ],
 )
-def test_int_literal(construct_ast, source: str, value: int):
-    """Test IntLiteral Construction of different Format Representations."""
+def test_int_literal_lexing(source: str, value: int):
+    """Test that each IntLiteral Format is lexed as a single INT_LITERAL token."""
+    text, token_type = lex_one(source)
+    assert token_type == FhYLexer.INT_LITERAL, "Expected an INT_LITERAL token."
+    assert int(text, 0) == value, f"Expected token text to represent {value}: {text}"
+
+
+@pytest.mark.parametrize(
+    "source, value",
+    [("1;", 1), ("0b0101;", 5), ("0x1;", 1), ("0o1;", 1)],
+)
+def test_int_literal(source: str, value: int):
+    """Test IntLiteral Construction for each supported Integer Base."""
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.ExpressionStatement), wrong_node_babe(
-        ast.ExpressionStatement, statement
-    )
+    _require(statement, ast.ExpressionStatement)
     assert is_primitive_expression_equal(statement.right, ast.IntLiteral(value=value))
 
 
 @pytest.mark.parametrize(
     "source, value",
-    [("1.0;", 1.0), (".2;", 0.2), (" 1.;", 1.0), (" 1e2;", 100.0), ("1.2e3;", 1200.0)],
+    [(".2;", 0.2), (" 1.;", 1.0), (" 1e2;", 100.0)],
+)
+def test_float_literal_lexing(source: str, value: float):
+    """Test that each FloatLiteral Format is lexed as a single FLOAT_LITERAL token."""
+    text, token_type = lex_one(source)
+    assert token_type == FhYLexer.FLOAT_LITERAL, "Expected a FLOAT_LITERAL token."
+    assert float(text) == value, f"Expected token text to represent {value}: {text}"
+
+
+@pytest.mark.parametrize(
+    "source, value",
+    [("1.0;", 1.0), ("1.2e3;", 1200.0)],
 )
-def test_float_literal(construct_ast, source: str, value: float):
+def test_float_literal(source: str, value: float):
     """Test FloatLiteral Construction of different Format Representations."""
     _ast: ast.Module = construct_ast(source)
     _assert_is_expected_module(_ast, 1)
 
     statement = _ast.statements[0]
-    assert isinstance(statement, ast.ExpressionStatement), wrong_node_babe(
-        ast.ExpressionStatement, statement
-    )
+    _require(statement, ast.ExpressionStatement)
     assert is_primitive_expression_equal(statement.right, ast.FloatLiteral(value=value))
 
 
 # =============
 # MISCELLANEOUS
 # =============
-def test_line_comment(construct_ast):
+def test_line_comment():
     """Test that comments are skipped, creating an empty Module."""
     source: str = "# this is a comment!"
     _ast = construct_ast(source)
     _assert_is_expected_module(_ast, 0)
 
 
-def test_empty_procedure_with_line_comment(construct_ast):
+def test_empty_procedure_with_line_comment():
     """Test procedure is found and constructed with line comments in the mix."""
     source: str = "# this is a comment!\nproc foo(input int32[m,n] A) {}"
     _ast = construct_ast(source)
@@ -978,53 +1030,30 @@ def test_empty_procedure_with_line_comment(construct_ast):
 # ===============
 # EXPECTED ERRORS
 # ===============
-def test_syntax_error_no_argument_name(construct_ast):
-    """Raise FhYSyntaxError when an function Argument is defined without a Name."""
-    source: str = "op foo(input int32[m,n]) -> output int32 {}"
-    with pytest.raises(error.FhYSyntaxError):
-        _ast = construct_ast(source)
-
-
-def test_syntax_error_no_procedure_name(construct_ast):
-    """Raise Syntax Error when an Operation is defined without a Name."""
-    source: str = "proc () {}"
-    # NOTE: This raises the Antlr Syntax Error, not from our visitor class.
-    #       This means we do not gain coverage in parse tree converter for this case.
-    with pytest.raises(error.FhYSyntaxError):
-        _ast = construct_ast(source)
-
-
-def test_syntax_error_no_operation_name(construct_ast):
-    """Raise Syntax Error when an Operation is defined without a Name."""
-    source: str = "op (input int32[m,n] A) -> output int32 {}"
-    # NOTE: This raises the Antlr Syntax Error, not from our visitor class.
-    #       This means we do not gain coverage in parse tree converter for this case.
-    with pytest.raises(error.FhYSyntaxError):
-        _ast = construct_ast(source)
-
-
-def test_syntax_error_no_operation_return_type(construct_ast):
-    """Raise FhYSyntaxError when an Operation is defined without a return type."""
-    source: str = "op func(input int32[m,n] A) {}"
-    with pytest.raises(error.FhYSyntaxError):
-        _ast = construct_ast(source)
-
-
-def test_invalid_function_keyword(construct_ast):
-    """Raise FhySyntaxError when Function is Declared with Invalid Keyword."""
-    source: str = "def foo(input int32[m,n] A) -> output int32[m,n] {}"
-    with pytest.raises(error.FhYSyntaxError):
-        _ast = construct_ast(source)
-
-
 @pytest.mark.parametrize(
-    ["source"],
+    "source",
     [
-        ("lorem ipsum dolor sit amet;",),  # With Semicolon
-        ("lorem ipsum dolor sit amet",),  # No Semicolon
+        pytest.param(
+            "op foo(input int32[m,n]) -> output int32 {}", id="no_argument_name"
+        ),
+        # NOTE: The missing-name cases raise the Antlr Syntax Error, not from our
+        #       visitor class. This means we do not gain coverage in parse tree
+        #       converter for those cases.
+        pytest.param("proc () {}", id="no_procedure_name"),
+        pytest.param(
+            "op (input int32[m,n] A) -> output int32 {}", id="no_operation_name"
+        ),
+        pytest.param("op func(input int32[m,n] A) {}", id="no_operation_return_type"),
+        pytest.param(
+            "def foo(input int32[m,n] A) -> output int32[m,n] {}",
+            id="invalid_function_keyword",
+        ),
+        # Gibberish: unrecognized text according to fhy grammar.
+        pytest.param("lorem ipsum dolor sit amet;", id="gibberish_with_semicolon"),
+        pytest.param("lorem ipsum dolor sit amet", id="gibberish_without_semicolon"),
     ],
 )
-def test_gibberish(construct_ast, source: str):
-    """Gibberish (unrecognized text according to fhy grammar) Raises FhySyntaxError."""
+def test_syntax_errors(source: str):
+    """Malformed source Raises FhYSyntaxError while constructing the AST."""
     with pytest.raises(error.FhYSyntaxError):
-        _ast = construct_ast(source)
+        construct_ast(source)
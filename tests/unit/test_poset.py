@@ -0,0 +1,66 @@
+"""Unit Test the poset module for basic expected behavior."""
+
+import pytest
+from fhy.utils.poset import PartiallyOrderedSet
+
+
+@pytest.fixture
+def int_poset() -> PartiallyOrderedSet:
+    poset = PartiallyOrderedSet[int]()
+    poset.add_element(1)
+    poset.add_element(2)
+
+    return poset
+
+
+def test_add_element(int_poset):
+    """Test that we correctly add unordered elements to the poset."""
+    assert len(int_poset) == 2, "Expected Length 2 in Poset."
+    assert 1 in int_poset and 2 in int_poset, "Expected elements 1 and 2 in Poset."
+    assert list(int_poset) == [1, 2], "Expected Insertion Order to be Preserved."
+    assert not int_poset.is_less_than(1, 2), "Expected no order before add_order."
+
+
+def test_add_duplicate_element_error(int_poset):
+    """Adding an element already present in the poset should raise a ValueError."""
+    with pytest.raises(ValueError):
+        int_poset.add_element(1)
+
+
+def test_add_order(int_poset):
+    """Test that an order relation is recorded in both directions."""
+    int_poset.add_order(1, 2)
+
+    assert int_poset.is_less_than(1, 2), "Expected 1 to precede 2."
+    assert int_poset.is_greater_than(2, 1), "Expected 2 to succeed 1."
+    assert not int_poset.is_less_than(2, 1), "Expected strict order (no symmetry)."
+
+
+def test_transitive_order(int_poset):
+    """Order relations propagate transitively through intermediate elements."""
+    int_poset.add_element(3)
+    int_poset.add_order(1, 2)
+    int_poset.add_order(2, 3)
+
+    assert int_poset.is_less_than(1, 3), "Expected transitive order 1 < 3."
+    assert int_poset.is_greater_than(3, 1), "Expected transitive order 3 > 1."
+
+
+def test_invalid_order(int_poset):
+    """Relations introducing a cycle (or self-order) should raise a ValueError."""
+    int_poset.add_order(1, 2)
+
+    with pytest.raises(ValueError):
+        int_poset.add_order(2, 1)
+
+    with pytest.raises(ValueError):
+        int_poset.add_order(1, 1)
+
+
+def test_order_unknown_element_error(int_poset):
+    """Querying or ordering an element not in the poset should raise a KeyError."""
+    with pytest.raises(KeyError):
+        int_poset.add_order(1, 3)
+
+    with pytest.raises(KeyError):
+        int_poset.is_less_than(3, 1)
@@ -27,12 +27,13 @@ def test_stack_peek(text_stack):
     assert len(text_stack) == len(text_stack._stack) == 2, "Expected Length 2 in Stack."
 
 
-def test_stack_peek_error():
-    """Raise an Indexerror when peek is called on an Empty Stack."""
+@pytest.mark.parametrize("method", ["peek", "pop"])
+def test_stack_empty_access_error(method: str):
+    """Raise an Indexerror when peek or pop is called on an Empty Stack."""
     stack = Stack[str]()
 
     with pytest.raises(IndexError):
-        stack.peek()
+        getattr(stack, method)()
 
 
 def test_stack_pop(text_stack):
@@ -46,14 +47,6 @@ def test_stack_pop(text_stack):
     assert len(text_stack) == len(text_stack._stack) == 0, "Expected Length 0 in Stack."
 
 
-def test_stack_pop_error():
-    """Attempts to pop an element from an Empty Stack should raise an Indexerror."""
-    stack = Stack[str]()
-
-    with pytest.raises(IndexError):
-        stack.pop()
-
-
 def test_stack_clear(text_stack):
     """Tests that clear method, removes all elements from the stack."""
     text_stack.clear()